@@ -0,0 +1,99 @@
+"""Streamlit entry point for the LiSSA configuration builder.
+
+Run with ``streamlit run config_tool/app.py`` from the repository root.
+"""
+
+import orjson
+import streamlit as st
+
+import ui_sections
+from catalog_loader import load_catalog_sections
+from helpers import bump_widget_epoch, normalize_store_config, refresh_widget_epoch
+from template_utils import (
+    available_templates,
+    default_template_label,
+    initial_config,
+    load_json,
+)
+
+
+def init_session() -> None:
+    if "config_data" not in st.session_state:
+        templates = available_templates()
+        st.session_state["config_data"] = initial_config(templates)
+        st.session_state["template_name"] = default_template_label(templates)
+    st.session_state.setdefault("widget_epoch", 0)
+    st.session_state.setdefault("output_path", "config.json")
+
+
+def load_template(name: str) -> None:
+    templates = available_templates()
+    path = templates.get(name)
+    if path is None:
+        st.sidebar.error(f"Unknown template: {name}")
+        return
+    st.session_state["config_data"] = load_json(path)
+    st.session_state["template_name"] = name
+    bump_widget_epoch()
+
+
+def render_sidebar() -> None:
+    st.sidebar.title("LiSSA config builder")
+    templates = available_templates()
+    template_keys = list(templates)
+    current = st.session_state.get("template_name")
+    names = tuple(template_keys)
+    cached_index = st.session_state.get("_template_index")
+    # The name tuple is stored next to the map: a rename keeps the count the
+    # same, so the rebuild has to key on the names themselves.
+    if cached_index is None or cached_index[0] != names:
+        index_map = {name: position for position, name in enumerate(template_keys)}
+        st.session_state["_template_index"] = (names, index_map)
+    else:
+        index_map = cached_index[1]
+    index = index_map.get(current, 0)
+    selected = (
+        st.sidebar.selectbox("Template", template_keys, index=index)
+        if template_keys
+        else None
+    )
+    if selected is not None and st.sidebar.button("Load template"):
+        load_template(selected)
+    if st.sidebar.button("Reset to defaults"):
+        st.session_state["config_data"] = initial_config(templates)
+        st.session_state["template_name"] = default_template_label(templates)
+        bump_widget_epoch()
+    uploaded_config = st.sidebar.file_uploader("Import existing config", type="json")
+    if uploaded_config is not None and st.sidebar.button("Import"):
+        try:
+            imported = orjson.loads(uploaded_config.getvalue())
+        except orjson.JSONDecodeError as error:
+            st.sidebar.error(f"Invalid JSON: {error}")
+        else:
+            if not isinstance(imported, dict):
+                st.sidebar.error("Config must be a JSON object.")
+            else:
+                st.session_state["config_data"] = imported
+                st.session_state["template_name"] = None
+                bump_widget_epoch()
+
+
+def main() -> None:
+    st.set_page_config(page_title="LiSSA config builder", layout="wide")
+    init_session()
+    refresh_widget_epoch()
+    render_sidebar()
+    catalog = load_catalog_sections()
+    config = st.session_state["config_data"]
+    ui_sections.render_general_section(config)
+    ui_sections.render_artifact_provider_section(config, catalog)
+    ui_sections.render_preprocessor_section(config, catalog)
+    ui_sections.render_embedding_section(config, catalog)
+    ui_sections.render_store_section(config, catalog)
+    ui_sections.render_classifier_and_aggregation_section(config, catalog)
+    ui_sections.render_overrides_section(config)
+    notes = normalize_store_config(config)
+    ui_sections.render_preview_and_export(config, notes)
+
+
+main()
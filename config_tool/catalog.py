@@ -0,0 +1,196 @@
+"""Access to the module catalog that backs the selectors and help texts.
+
+The catalog (``catalog.json``) mirrors the module names accepted by the Java
+factories (``ArtifactProvider``, ``Preprocessor``, ``EmbeddingCreator``,
+``RetrievalStrategy``, ``Classifier``, ``ResultAggregator``, and
+``TraceLinkIdPostprocessor``) together with their arguments.
+"""
+
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+import orjson
+
+CATALOG_PATH = Path(__file__).resolve().parent / "catalog.json"
+
+_catalog_cache: dict[str, Any] | None = None
+
+
+def load_catalog() -> dict[str, Any]:
+    global _catalog_cache
+    if _catalog_cache is None:
+        catalog = orjson.loads(CATALOG_PATH.read_bytes())
+        _presort_granularity_levels(catalog)
+        _intern_names(catalog)
+        _catalog_cache = _freeze(catalog)
+    return _catalog_cache
+
+
+def _intern_names(node: Any) -> None:
+    """Interns module name strings (orjson does not intern parsed strings),
+    turning the frequent name comparisons into pointer checks."""
+    if isinstance(node, dict):
+        name = node.get("name")
+        if isinstance(name, str):
+            node["name"] = sys.intern(name)
+        for value in node.values():
+            _intern_names(value)
+    elif isinstance(node, list):
+        for value in node:
+            _intern_names(value)
+
+
+def _freeze(node: Any) -> Any:
+    """Deep-freezes the catalog (dicts to mapping proxies, lists to tuples).
+
+    The identity-keyed help caches rely on catalog nodes never changing, and
+    freezing turns accidental mutation into an immediate error.
+    """
+    if isinstance(node, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in node.items()})
+    if isinstance(node, (list, tuple)):
+        return tuple(_freeze(value) for value in node)
+    return node
+
+
+def _presort_granularity_levels(node: Any) -> None:
+    """Replaces ``granularity_levels`` dicts with pre-sorted (level, text)
+    pair lists so help rendering never sorts per call."""
+    if isinstance(node, dict):
+        levels = node.get("granularity_levels")
+        if isinstance(levels, dict):
+            node["granularity_levels"] = sorted(
+                levels.items(),
+                key=lambda item: (0, int(item[0]))
+                if str(item[0]).isdigit()
+                else (1, str(item[0])),
+            )
+        for value in node.values():
+            _presort_granularity_levels(value)
+    elif isinstance(node, list):
+        for value in node:
+            _presort_granularity_levels(value)
+
+
+def _resolve_pointer(pointer: Any) -> tuple[bool, Any]:
+    """Resolves an ``@a.b.c`` reference into the catalog.
+
+    Returns ``(is_pointer, resolved)`` so callers can reuse the pointer
+    classification instead of re-checking the value themselves.
+    """
+    if not isinstance(pointer, str) or not pointer.startswith("@"):
+        return False, None
+    return True, _resolve_pointer_cached(pointer)
+
+
+@lru_cache(maxsize=512)
+def _resolve_pointer_cached(pointer: str) -> Any:
+    parts = pointer[1:].split(".")
+    catalog = load_catalog()
+    if len(parts) == 2:
+        # The common two-level case (e.g. @classifiers.platforms) unrolled.
+        first = catalog.get(parts[0])
+        return first.get(parts[1]) if isinstance(first, Mapping) else None
+    node: Any = catalog
+    for part in parts:
+        if not isinstance(node, Mapping):
+            return None
+        node = node.get(part)
+    return node
+
+
+# Keyed on id(): module definitions and their args dicts come from the cached
+# catalog and live for the whole process, so identity is a stable key.
+_args_cache: dict[int, list[str]] = {}
+_help_cache: dict[int, str] = {}
+
+
+def describe_args(args: dict[str, Any]) -> list[str]:
+    """Renders one markdown bullet per argument specification."""
+    cached = _args_cache.get(id(args))
+    if cached is None:
+        cached = _args_cache[id(args)] = _build_args_description(args)
+    return cached
+
+
+def _build_args_description(args: dict[str, Any]) -> list[str]:
+    items: list[str] = []
+    for key, spec in args.items():
+        # Each bullet is assembled in one parts list and joined once, instead
+        # of stacking intermediate f-strings per fragment.
+        parts = ["- `", key, "` [", str(spec.get("type", "string"))]
+        if spec.get("required"):
+            parts.append(" (required)")
+        default = spec.get("default")
+        if default is not None:
+            parts.append(f", default: `{default}`")
+        values = spec.get("values")
+        is_pointer, resolved_values = _resolve_pointer(values)
+        if resolved_values is None:
+            resolved_values = values
+        if isinstance(resolved_values, Mapping):
+            parts.append(", one of: ")
+            parts.append(", ".join(sorted(resolved_values)))
+        elif isinstance(resolved_values, (list, tuple)):
+            parts.append(", one of: ")
+            parts.append(", ".join(str(value) for value in resolved_values))
+        if is_pointer:
+            parts.append(" via `")
+            parts.append(values)
+            parts.append("`")
+        parts.append("]: ")
+        parts.append(spec.get("description", ""))
+        items.append("".join(parts).rstrip())
+    return items
+
+
+def module_help_text(module_def: dict[str, Any] | None) -> str:
+    """Builds the markdown help block for a single module definition.
+
+    ``None`` (unknown or custom module names) returns early, so callers can
+    pass ``defs.get(name)`` straight through without their own guard.
+    """
+    if not module_def:
+        return ""
+    cached = _help_cache.get(id(module_def))
+    if cached is None:
+        cached = _help_cache[id(module_def)] = _build_help_text(module_def)
+    return cached
+
+
+def _build_help_text(module_def: dict[str, Any]) -> str:
+    lines: list[str] = []
+    # One-shot probe of all optional keys; no default containers are built.
+    description, naming_rule, env, granularity_levels, args = (
+        module_def.get(key)
+        for key in ("description", "naming_rule", "env", "granularity_levels", "args")
+    )
+    if description:
+        lines.append(description)
+    if naming_rule:
+        lines.append(f"*Naming:* {naming_rule}")
+    if env:
+        lines.append("*Environment:* " + ", ".join(f"`{name}`" for name in env))
+    if granularity_levels:
+        lines.append("*Granularity levels:*")
+        for level, text in granularity_levels:
+            lines.append(f"- `{level}`: {text}")
+    if args:
+        lines.append("*Arguments:*")
+        lines.extend(describe_args(args))
+    return "\n\n".join(lines)
+
+
+def module_help_markdown(module_def: dict[str, Any] | None) -> str | None:
+    """Like :func:`module_help_text` but returns ``None`` for empty help.
+
+    Memoization happens in module_help_text's identity cache, which is shared
+    across sessions and cheaper than an st.cache_data hash per call; keeping
+    this module Streamlit-free also keeps it importable from plain tests.
+    """
+    text = module_help_text(module_def)
+    return text or None
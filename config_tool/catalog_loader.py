@@ -0,0 +1,156 @@
+"""Pre-indexed views of the module catalog used by the UI sections."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any
+
+import streamlit as st
+
+from catalog import load_catalog
+from helpers import CUSTOM_OPTION, NONE_OPTION
+
+ConfigDict = dict[str, Any]
+
+_PREWARM_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+_prewarm_future: Future | None = None
+
+
+def prewarm_catalog() -> None:
+    """Starts parsing the catalog on a worker thread.
+
+    Called at import time so the parse overlaps Streamlit's own startup; the
+    first load_catalog_sections call then only waits for the remainder.
+    """
+    global _prewarm_future
+    if _prewarm_future is None:
+        _prewarm_future = _PREWARM_EXECUTOR.submit(load_catalog)
+
+
+def _index_by_name(entries: list[ConfigDict]) -> dict[str, ConfigDict]:
+    return {entry["name"]: entry for entry in entries}
+
+
+def _bundle(defs: dict[str, ConfigDict]) -> dict[str, Any]:
+    """Packs a defs dict with its pre-sorted names and selectbox options."""
+    sorted_names = sorted(defs)
+    options = [CUSTOM_OPTION] + sorted_names
+    return {
+        "defs": defs,
+        "sorted_names": sorted_names,
+        "options": options,
+        "index_of": {name: index for index, name in enumerate(options)},
+    }
+
+
+@lru_cache(maxsize=1)
+def artifact_provider_defs() -> dict[str, ConfigDict]:
+    return _index_by_name(load_catalog().get("artifact_providers", []))
+
+
+@lru_cache(maxsize=1)
+def preprocessor_defs() -> dict[str, ConfigDict]:
+    return _index_by_name(load_catalog().get("preprocessors", []))
+
+
+@lru_cache(maxsize=1)
+def embedding_defs() -> dict[str, ConfigDict]:
+    return _index_by_name(load_catalog().get("embedding_creators", []))
+
+
+@lru_cache(maxsize=4)
+def store_defs(kind: str) -> dict[str, ConfigDict]:
+    defs = _index_by_name(load_catalog().get("stores", []))
+    if kind == "source":
+        # The source store never retrieves, so retrieval strategies are hidden.
+        return {name: d for name, d in defs.items() if not d.get("retrieval_only")}
+    return defs
+
+
+@lru_cache(maxsize=1)
+def classifier_mode_defs() -> dict[str, ConfigDict]:
+    return dict(load_catalog().get("classifiers", {}).get("modes", {}))
+
+
+@lru_cache(maxsize=1)
+def classifier_platform_defs() -> dict[str, ConfigDict]:
+    return dict(load_catalog().get("classifiers", {}).get("platforms", {}))
+
+
+@lru_cache(maxsize=1)
+def classifier_mode_options() -> tuple[str, ...]:
+    return (CUSTOM_OPTION, *sorted(classifier_mode_defs()))
+
+
+@lru_cache(maxsize=1)
+def classifier_platform_options() -> tuple[str, ...]:
+    return (NONE_OPTION, CUSTOM_OPTION, *sorted(classifier_platform_defs()))
+
+
+@lru_cache(maxsize=1)
+def classifier_mode_index_of() -> dict[str, int]:
+    return {name: index for index, name in enumerate(classifier_mode_options())}
+
+
+@lru_cache(maxsize=1)
+def classifier_platform_index_of() -> dict[str, int]:
+    return {name: index for index, name in enumerate(classifier_platform_options())}
+
+
+@lru_cache(maxsize=1)
+def classifier_index() -> dict[str, tuple[ConfigDict | None, ConfigDict | None, str]]:
+    """Maps every known classifier name to (mode_def, platform_def, platform).
+
+    Covers the cartesian product of modes and platforms plus the bare mode
+    names, so classifier_help is a single dict lookup.
+    """
+    modes = classifier_mode_defs()
+    platforms = classifier_platform_defs()
+    index: dict[str, tuple[ConfigDict | None, ConfigDict | None, str]] = {
+        f"{mode}_{platform.lower()}": (modes[mode], platforms[platform], platform)
+        for mode in modes
+        if mode != "mock"
+        for platform in platforms
+    }
+    for mode, mode_def in modes.items():
+        index[mode] = (mode_def, None, "")
+    return index
+
+
+@lru_cache(maxsize=1)
+def result_aggregator_defs() -> dict[str, ConfigDict]:
+    return _index_by_name(load_catalog().get("result_aggregators", []))
+
+
+@lru_cache(maxsize=1)
+def postprocessor_defs() -> dict[str, ConfigDict]:
+    return _index_by_name(load_catalog().get("tracelinkid_postprocessors", []))
+
+
+@st.cache_resource(show_spinner=False)
+def load_catalog_sections() -> dict[str, Any]:
+    """Bundles all per-section indices the page needs into one dict.
+
+    Cached as a resource so the indices survive script reloads and are shared
+    across sessions; treat the returned structure as read-only.
+    """
+    if _prewarm_future is not None:
+        _prewarm_future.result()
+    return {
+        "artifact_providers": _bundle(artifact_provider_defs()),
+        "preprocessors": _bundle(preprocessor_defs()),
+        "embedding_creators": _bundle(embedding_defs()),
+        "source_stores": _bundle(store_defs("source")),
+        "target_stores": _bundle(store_defs("target")),
+        "classifier_modes": classifier_mode_defs(),
+        "classifier_platforms": classifier_platform_defs(),
+        "classifier_mode_options": classifier_mode_options(),
+        "classifier_platform_options": classifier_platform_options(),
+        "classifier_mode_index_of": classifier_mode_index_of(),
+        "classifier_platform_index_of": classifier_platform_index_of(),
+        "classifier_index": classifier_index(),
+        "result_aggregators": _bundle(result_aggregator_defs()),
+        "tracelinkid_postprocessors": _bundle(postprocessor_defs()),
+    }
+
+
+prewarm_catalog()
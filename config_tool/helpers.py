@@ -0,0 +1,266 @@
+"""Shared widgets and dict utilities for the configuration builder."""
+
+import copy
+import sys
+from collections import deque
+from typing import Any
+
+import orjson
+import streamlit as st
+
+ConfigDict = dict[str, Any]
+
+CUSTOM_OPTION = "<custom>"
+NONE_OPTION = "<none>"
+
+
+def widget_epoch() -> int:
+    """Epoch counter baked into widget keys; bumping it remounts all widgets."""
+    return st.session_state.get("widget_epoch", 0)
+
+
+def refresh_widget_epoch() -> None:
+    """Caches the epoch suffix for :func:`widget_key`; called at script entry
+    so widget keys concatenate a prebuilt string instead of formatting.
+
+    The suffix lives in session state: sessions run concurrently on threads
+    of one process, so a module-global cache would leak one session's epoch
+    into another's widget keys.
+    """
+    st.session_state["_epoch_suffix"] = f"::{widget_epoch()}"
+
+
+def bump_widget_epoch() -> None:
+    st.session_state["widget_epoch"] = widget_epoch() + 1
+    refresh_widget_epoch()
+
+
+def widget_key(base: str) -> str:
+    return base + st.session_state.get("_epoch_suffix", "::0")
+
+
+def safe_copy(data: ConfigDict) -> ConfigDict:
+    # orjson round-trips JSON-shaped data much faster than copy.deepcopy;
+    # deepcopy stays as the fallback for non-JSON values.
+    if not data:
+        return {}
+    try:
+        return orjson.loads(orjson.dumps(data))
+    except TypeError:
+        return copy.deepcopy(data)
+
+
+def ensure_section(config: ConfigDict, path: list[str], default: Any) -> Any:
+    """Walks ``path`` into ``config`` and returns the value at the leaf.
+
+    Missing or malformed intermediate nodes are replaced by fresh dicts, and a
+    missing leaf is initialized with a copy of ``default``.
+    """
+    node = config
+    for key in path[:-1]:
+        child = node.get(key)
+        if not isinstance(child, dict):
+            child = {}
+            node[key] = child
+        node = child
+    leaf = path[-1]
+    value = node.get(leaf)
+    if not isinstance(value, type(default)):
+        if isinstance(default, dict) and all(
+            not isinstance(item, (dict, list)) or not item for item in default.values()
+        ):
+            # Call sites pass small flat literals like {"name": "text",
+            # "args": {}}; rebuilding those directly beats a serialization
+            # round-trip.
+            value = {
+                key: ({} if isinstance(item, dict) else [] if isinstance(item, list) else item)
+                for key, item in default.items()
+            }
+        elif isinstance(default, (dict, list)):
+            value = safe_copy(default)
+        else:
+            value = copy.deepcopy(default)
+        node[leaf] = value
+    return value
+
+
+def merge_dict(base: ConfigDict, overrides: ConfigDict) -> ConfigDict:
+    """Merges ``overrides`` into ``base`` (in place), nested dicts included.
+
+    Implemented with an explicit stack so deep override payloads neither pay
+    per-level call overhead nor run into the recursion limit.
+    """
+    stack = deque([(base, overrides)])
+    while stack:
+        base_node, override_node = stack.pop()
+        for key, value in override_node.items():
+            base_value = base_node.get(key)
+            # Both sides are plain parsed-JSON dicts, so the exact type check
+            # is safe and skips the MRO walk isinstance would do.
+            if type(value) is dict and type(base_value) is dict:
+                stack.append((base_value, value))
+            else:
+                base_node[key] = value
+    return base
+
+
+def parse_arg_value(text: str) -> Any:
+    """Parses an args-editor cell: JSON for nested values, string otherwise.
+
+    Module arguments are passed to LiSSA as strings, so scalars stay strings;
+    only values that look like JSON objects or arrays are parsed.
+    """
+    cleaned = text.strip()
+    if not cleaned or cleaned[0] not in "{[":
+        return cleaned
+    try:
+        return orjson.loads(cleaned)
+    except orjson.JSONDecodeError:
+        return cleaned
+
+
+def value_to_text(value: Any) -> str:
+    """Inverse of :func:`parse_arg_value` for populating editor cells."""
+    # Strings dominate real configs, so they short-circuit before any
+    # isinstance checks or encoding work.
+    if type(value) is str:
+        return value
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        # orjson emits compact separators, keeping cell text short.
+        return orjson.dumps(value).decode()
+    return str(value)
+
+
+def module_name_input(label: str, bundle: ConfigDict, current: str, key: str) -> str:
+    """Selectbox over a catalog bundle's module names with a custom escape.
+
+    ``bundle`` is a section bundle from ``load_catalog_sections`` carrying the
+    defs dict plus its pre-sorted names and options, so no sorting happens
+    per rerun.
+    """
+    options = bundle["options"]
+    # Membership and index lookups are O(1) against the bundle's dicts; no
+    # sorting or list scans happen per rerun.
+    has_known = current in bundle["defs"]
+    index = bundle["index_of"].get(current, 0)
+    choice = st.selectbox(label, options, index=index, key=widget_key(key))
+    if choice == CUSTOM_OPTION:
+        return st.text_input(
+            f"{label} (custom name)",
+            value="" if has_known else current,
+            key=widget_key(f"{key}-custom"),
+        ).strip()
+    return choice
+
+
+def render_args_editor(args: ConfigDict, key_prefix: str) -> ConfigDict:
+    """Renders an editable parameter table for a module ``args`` dict."""
+    rows_cache = st.session_state.setdefault("_args_rows_cache", {})
+    cached = rows_cache.get(key_prefix)
+    # The cached args dict itself is kept alongside the rows: an identity
+    # check on a bare id() could collide once the original dict is freed and
+    # its address reused, seeding the editor with stale rows.
+    if cached is not None and cached[0] is args:
+        rows = cached[1]
+    else:
+        rows = [
+            {"Parameter": name, "Value": value_to_text(value)}
+            for name, value in args.items()
+        ]
+        rows_cache[key_prefix] = (args, rows)
+    edited_rows = st.data_editor(
+        rows,
+        num_rows="dynamic",
+        key=widget_key(f"{key_prefix}-args"),
+        column_config={
+            "Parameter": st.column_config.TextColumn("Parameter"),
+            "Value": st.column_config.TextColumn("Value"),
+        },
+        hide_index=True,
+    )
+    new_args = {
+        name: parse_arg_value(str(row.get("Value") or ""))
+        for row in edited_rows
+        if (name := str(row.get("Parameter") or "").strip())
+    }
+    # Returning the input dict when nothing changed keeps its identity stable
+    # across reruns -- callers rebind section["args"] to the return value, so
+    # a fresh dict every run would mean the rows cache above can never hit.
+    return args if new_args == args else new_args
+
+
+def classifier_help(
+    name: str, classifier_index: dict[str, tuple]
+) -> tuple[ConfigDict | None, ConfigDict | None, str] | None:
+    """Looks up the catalog entries for a classifier name like ``simple_openai``.
+
+    ``classifier_index`` is the precomputed name index from the catalog
+    loader; unknown platform suffixes fall back to the bare mode entry.
+    """
+    entry = classifier_index.get(name)
+    if entry is None:
+        entry = classifier_index.get(name.partition("_")[0])
+    return entry
+
+
+# Interned so the per-rerun name comparisons short-circuit on identity.
+_CUSTOM = sys.intern("custom")
+_COSINE = sys.intern("cosine_similarity")
+
+_STORE_NORMALIZATION = (
+    (
+        "target_store",
+        _COSINE,
+        (_CUSTOM,),
+        'target_store "{alias}" is a legacy alias and was renamed to "{name}".',
+    ),
+    (
+        "source_store",
+        _CUSTOM,
+        (_COSINE,),
+        'source_store does not retrieve, so "{alias}" was renamed to "{name}".',
+    ),
+)
+
+
+def normalize_store_config(config: ConfigDict) -> list[str]:
+    """Fixes up legacy store names in place and returns explanatory notes.
+
+    Mirrors the aliases accepted by ``RetrievalStrategy`` on the Java side:
+    ``custom`` as a target store is a legacy alias for ``cosine_similarity``,
+    and the source store never uses a retrieval strategy. The per-store rules
+    live in ``_STORE_NORMALIZATION`` so both stores run through one loop.
+
+    This runs on every rerun, so a light signature of the store sections is
+    kept in session state and unchanged configs return immediately.
+    """
+    sig = tuple(
+        (store.get("name"), isinstance(store.get("args"), dict))
+        if isinstance(store, dict)
+        else (None, False)
+        for store in (config.get("target_store"), config.get("source_store"))
+    )
+    if st.session_state.get("_store_sig") == sig:
+        return []
+    notes: list[str] = []
+    for key, required_name, legacy_aliases, note in _STORE_NORMALIZATION:
+        store = config.get(key)
+        if not isinstance(store, dict):
+            continue
+        name = store.get("name")
+        if name in legacy_aliases:
+            store["name"] = required_name
+            notes.append(note.format(alias=name, name=required_name))
+        if not isinstance(store.get("args"), dict):
+            store["args"] = {}
+    st.session_state["_store_sig"] = tuple(
+        (store.get("name"), isinstance(store.get("args"), dict))
+        if isinstance(store, dict)
+        else (None, False)
+        for store in (config.get("target_store"), config.get("source_store"))
+    )
+    return notes
@@ -0,0 +1,90 @@
+"""Helpers for locating, loading, and saving configuration templates."""
+
+import os
+from pathlib import Path
+from typing import Any
+
+import orjson
+import streamlit as st
+
+ConfigDict = dict[str, Any]
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+OUTPUT_DIR = Path.cwd()
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _available_templates_cached(mtime_ns: int) -> dict[str, Path]:
+    del mtime_ns  # cache key only: adding or removing files bumps the dir mtime
+    # os.scandir avoids pathlib's pattern matching and per-match Path objects.
+    with os.scandir(TEMPLATE_DIR) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.is_file() and entry.name.endswith(".json")
+        )
+    return {name[: -len(".json")]: TEMPLATE_DIR / name for name in names}
+
+
+def available_templates() -> dict[str, Path]:
+    """Returns a mapping from template label to its JSON file.
+
+    The listing is an os.scandir pass cached on the directory mtime, so a
+    steady-state call is one stat plus a cache lookup.
+    """
+    return _available_templates_cached(TEMPLATE_DIR.stat().st_mtime_ns)
+
+
+def invalidate_templates() -> None:
+    """Clears the cached template listing and parsed template files.
+
+    Mainly useful in tests and when templates are edited while the app runs
+    faster than the mtime-based keys pick them up.
+    """
+    _available_templates_cached.clear()
+    _load_json_cached.clear()
+
+
+def default_template_label(templates: dict[str, Path] | None = None) -> str | None:
+    """Returns the label of the template that is preselected in the sidebar."""
+    if templates is None:
+        templates = available_templates()
+    return next(iter(templates), None)
+
+
+def initial_config(templates: dict[str, Path] | None = None) -> ConfigDict:
+    """Returns the configuration the app starts with (the first template)."""
+    if templates is None:
+        templates = available_templates()
+    if not templates:
+        return {}
+    return load_json(next(iter(templates.values())))
+
+
+@st.cache_data(persist="disk", show_spinner=False)
+def _load_json_cached(path_str: str, mtime_ns: int) -> ConfigDict:
+    del mtime_ns  # cache key only: invalidates when the file changes
+    # Reading bytes and parsing with orjson skips the text-mode decode pipeline.
+    return orjson.loads(Path(path_str).read_bytes())
+
+
+def load_json(path: Path) -> ConfigDict:
+    # st.cache_data hands out a fresh copy per call, so callers may mutate.
+    return _load_json_cached(str(path), path.stat().st_mtime_ns)
+
+
+def resolve_path(destination: str) -> Path:
+    """Resolves a user-entered destination relative to the working directory."""
+    path = Path(destination).expanduser()
+    if not path.is_absolute():
+        path = OUTPUT_DIR / path
+    return path
+
+
+def save_config_to_disk(config: ConfigDict, destination: str) -> Path:
+    path = resolve_path(destination)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(
+        orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    )
+    return path
@@ -0,0 +1,348 @@
+"""The individual editor sections of the configuration builder page."""
+
+from functools import lru_cache
+from typing import Any
+
+import orjson
+import streamlit as st
+
+from catalog import module_help_markdown
+from helpers import (
+    CUSTOM_OPTION,
+    NONE_OPTION,
+    bump_widget_epoch,
+    classifier_help,
+    ensure_section,
+    merge_dict,
+    module_name_input,
+    render_args_editor,
+    widget_key,
+)
+from template_utils import save_config_to_disk
+
+ConfigDict = dict[str, Any]
+
+# Common spellings of a true hasHeader; a hit is one hash lookup, and other
+# strings fall back to the lowering compare the frozenset replaced. JSON
+# booleans are checked with "is True" separately: True hashes like 1, and 1
+# must stay false to match the backend's boolean parsing.
+_TRUTHY = frozenset({"true", "True", "TRUE"})
+
+_PROVIDER_SECTIONS = (
+    ("Source", "source_artifact_provider"),
+    ("Target", "target_artifact_provider"),
+)
+_PREPROCESSOR_SECTIONS = (
+    ("Source", "source_preprocessor"),
+    ("Target", "target_preprocessor"),
+)
+_STORE_SECTIONS = (
+    ("Source", "source_store", "source_stores", "custom"),
+    ("Target", "target_store", "target_stores", "cosine_similarity"),
+)
+
+_KEY_MODE_SELECTOR = "classifier-mode-selector"
+_KEY_MODE_CUSTOM = "classifier-mode-custom"
+_KEY_PLATFORM_SELECTOR = "classifier-platform-selector"
+_KEY_PLATFORM_CUSTOM = "classifier-platform-custom"
+
+
+def _two_cols():
+    return st.columns(2, vertical_alignment="top")
+
+
+def _module_section(config: ConfigDict, key: str, default_name: str) -> ConfigDict:
+    """Returns ``config[key]`` ensured to the ``{"name", "args"}`` module shape.
+
+    The shape check doubles as a change guard: in the steady state (every
+    rerun after the first) the section already has the right shape, so no
+    defaults are built and no path walk happens.
+    """
+    section = config.get(key)
+    if type(section) is dict and type(section.get("args")) is dict:
+        return section
+    section = ensure_section(config, [key], {"name": default_name, "args": {}})
+    ensure_section(section, ["args"], {})
+    return section
+
+
+def render_general_section(config: ConfigDict) -> None:
+    with st.expander("1. General", expanded=True):
+        config["cache_dir"] = st.text_input(
+            "Cache directory",
+            value=config.get("cache_dir", ""),
+            key=widget_key("cache-dir"),
+            help="Directory where embeddings and model responses are cached.",
+        )
+        gold_config = ensure_section(
+            config, ["gold_standard_configuration"], {"path": "", "hasHeader": "false"}
+        )
+        gold_config["path"] = st.text_input(
+            "Gold standard CSV",
+            value=gold_config.get("path", ""),
+            key=widget_key("gold-path"),
+            help="Ground-truth trace links used by the evaluate command.",
+        )
+        has_header = gold_config.get("hasHeader")
+        index = (
+            0
+            if has_header is True
+            or (
+                isinstance(has_header, str)
+                and (has_header in _TRUTHY or has_header.lower() == "true")
+            )
+            else 1
+        )
+        gold_config["hasHeader"] = st.selectbox(
+            "Gold standard has header row",
+            ["true", "false"],
+            index=index,
+            key=widget_key("gold-has-header"),
+        )
+
+
+def render_artifact_provider_section(config: ConfigDict, catalog: dict[str, Any]) -> None:
+    with st.expander("2. Artifact providers", expanded=False):
+        provider_defs = catalog["artifact_providers"]
+        cols = _two_cols()
+        for idx, (label, section_key) in enumerate(_PROVIDER_SECTIONS):
+            section = _module_section(config, section_key, "text")
+            with cols[idx]:
+                st.markdown(f"**{label}**")
+                section["name"] = module_name_input(
+                    f"{label} provider", provider_defs, section.get("name", ""), f"{section_key}-name"
+                )
+                section["args"] = render_args_editor(section["args"], section_key)
+                help_markdown = module_help_markdown(provider_defs["defs"].get(section["name"]))
+                if help_markdown:
+                    st.markdown(help_markdown)
+
+
+def render_preprocessor_section(config: ConfigDict, catalog: dict[str, Any]) -> None:
+    with st.expander("3. Preprocessors", expanded=False):
+        preprocessor_defs = catalog["preprocessors"]
+        cols = _two_cols()
+        for idx, (label, section_key) in enumerate(_PREPROCESSOR_SECTIONS):
+            section = _module_section(config, section_key, "artifact")
+            with cols[idx]:
+                st.markdown(f"**{label}**")
+                section["name"] = module_name_input(
+                    f"{label} preprocessor",
+                    preprocessor_defs,
+                    section.get("name", ""),
+                    f"{section_key}-name",
+                )
+                section["args"] = render_args_editor(section["args"], section_key)
+                help_markdown = module_help_markdown(preprocessor_defs["defs"].get(section["name"]))
+                if help_markdown:
+                    st.markdown(help_markdown)
+
+
+def render_embedding_section(config: ConfigDict, catalog: dict[str, Any]) -> None:
+    with st.expander("4. Embedding creator", expanded=False):
+        embedding_defs = catalog["embedding_creators"]
+        section = _module_section(config, "embedding_creator", "openai")
+        section["name"] = module_name_input(
+            "Embedding creator", embedding_defs, section.get("name", ""), "embedding-name"
+        )
+        section["args"] = render_args_editor(section["args"], "embedding_creator")
+        help_markdown = module_help_markdown(embedding_defs["defs"].get(section["name"]))
+        if help_markdown:
+            st.markdown(help_markdown)
+
+
+def render_store_section(config: ConfigDict, catalog: dict[str, Any]) -> None:
+    with st.expander("5. Element stores", expanded=False):
+        cols = _two_cols()
+        for idx, (label, section_key, defs_key, default_name) in enumerate(_STORE_SECTIONS):
+            store_defs = catalog[defs_key]
+            section = _module_section(config, section_key, default_name)
+            with cols[idx]:
+                st.markdown(f"**{label} store**")
+                section["name"] = module_name_input(
+                    f"{label} store", store_defs, section.get("name", ""), f"{section_key}-name"
+                )
+                section["args"] = render_args_editor(section["args"], section_key)
+                help_markdown = module_help_markdown(store_defs["defs"].get(section["name"]))
+                if help_markdown:
+                    st.markdown(help_markdown)
+
+
+def render_classifier_and_aggregation_section(
+    config: ConfigDict, catalog: dict[str, Any]
+) -> None:
+    with st.expander("6. Classifier and aggregation", expanded=False):
+        classifier = _module_section(config, "classifier", "mock")
+        args = classifier["args"]
+        multi_stage_classifier = classifier.get("classifiers")
+        if isinstance(multi_stage_classifier, list):
+            st.info(
+                "This configuration uses a multi-stage classifier pipeline; "
+                "edit the stages via the raw overrides section."
+            )
+            st.code(
+                orjson.dumps(multi_stage_classifier, option=orjson.OPT_INDENT_2).decode(),
+                language="json",
+            )
+        else:
+            current_name = str(classifier.get("name", "") or "")
+            # partition is a single C call; no list allocation per rerun.
+            current_mode, _, current_platform = current_name.partition("_")
+            mode_options = catalog["classifier_mode_options"]
+            mode_index = catalog["classifier_mode_index_of"].get(current_mode, 0)
+            mode = st.selectbox(
+                "Classifier mode",
+                mode_options,
+                index=mode_index,
+                key=widget_key(_KEY_MODE_SELECTOR),
+            )
+            if mode == CUSTOM_OPTION:
+                mode = st.text_input(
+                    "Classifier mode (custom)",
+                    value=current_mode,
+                    key=widget_key(_KEY_MODE_CUSTOM),
+                ).strip()
+            platform_options = catalog["classifier_platform_options"]
+            upper_platform = current_platform.upper()
+            # Unknown but non-empty platforms land on <custom> (index 1).
+            platform_index = catalog["classifier_platform_index_of"].get(
+                upper_platform, 1 if current_platform else 0
+            )
+            platform = st.selectbox(
+                "Model platform",
+                platform_options,
+                index=platform_index,
+                key=widget_key(_KEY_PLATFORM_SELECTOR),
+            )
+            if platform == CUSTOM_OPTION:
+                platform = st.text_input(
+                    "Model platform (custom)",
+                    value=current_platform,
+                    key=widget_key(_KEY_PLATFORM_CUSTOM),
+                ).strip()
+            elif platform == NONE_OPTION:
+                platform = ""
+            classifier["name"] = f"{mode}_{platform.lower()}" if platform else mode
+            classifier["args"] = render_args_editor(args, "classifier")
+            help_entry = classifier_help(classifier["name"], catalog["classifier_index"])
+            if help_entry:
+                mode_def, platform_def, platform_key = help_entry
+                mode_help = module_help_markdown(mode_def)
+                if mode_help:
+                    st.markdown(mode_help)
+                platform_help = module_help_markdown(platform_def)
+                if platform_help:
+                    st.markdown(f"**Platform `{platform_key}`:**")
+                    st.markdown(platform_help)
+        aggregator_defs = catalog["result_aggregators"]
+        aggregator = _module_section(config, "result_aggregator", "any_connection")
+        aggregator["name"] = module_name_input(
+            "Result aggregator", aggregator_defs, aggregator.get("name", ""), "aggregator-name"
+        )
+        aggregator["args"] = render_args_editor(aggregator["args"], "result_aggregator")
+        aggregator_help = module_help_markdown(aggregator_defs["defs"].get(aggregator["name"]))
+        if aggregator_help:
+            st.markdown(aggregator_help)
+        postprocessor_defs = catalog["tracelinkid_postprocessors"]
+        postprocessor = _module_section(config, "tracelinkid_postprocessor", "identity")
+        postprocessor["name"] = module_name_input(
+            "Trace link ID postprocessor",
+            postprocessor_defs,
+            postprocessor.get("name", ""),
+            "postprocessor-name",
+        )
+        postprocessor["args"] = render_args_editor(
+            postprocessor["args"], "tracelinkid_postprocessor"
+        )
+
+
+def render_overrides_section(config: ConfigDict) -> None:
+    with st.expander("7. Raw overrides", expanded=False):
+        st.markdown("Paste a JSON object below; it is merged recursively into the configuration.")
+        override_text = st.text_area(
+            "Overrides (JSON)", value="", key=widget_key("raw-override-text"), height=160
+        )
+        if st.button("Apply overrides", key=widget_key("apply-overrides")):
+            cleaned = override_text.strip() if override_text else ""
+            # One-character gate: obvious non-objects never enter the parser.
+            if not cleaned or cleaned[0] != "{":
+                st.error("Overrides must be a JSON object.")
+                return
+            try:
+                overrides = orjson.loads(cleaned)
+            except orjson.JSONDecodeError as error:
+                st.error(f"Invalid JSON: {error}")
+                return
+            if not isinstance(overrides, dict):
+                st.error("Overrides must be a JSON object.")
+                return
+            if all(
+                type(value) is not dict or type(config.get(key)) is not dict
+                for key, value in overrides.items()
+            ):
+                # Flat patches (the common case) need no recursion: one
+                # C-level dict.update replaces the merge walk.
+                config.update(overrides)
+            else:
+                merge_dict(config, overrides)
+            # Remount the widgets like load_template does; otherwise the next
+            # rerun writes the retained widget state back over the merge.
+            bump_widget_epoch()
+            st.success("Overrides applied.")
+
+
+@lru_cache(maxsize=32)
+def _output_filename(output_path: str) -> str:
+    # rpartition keeps this to two C calls; no PurePath parsing per path.
+    name = output_path.rpartition("/")[2].rpartition("\\")[2]
+    return name or "config.json"
+
+
+@st.cache_data(show_spinner=False)
+def _serialize_preview(canon: bytes, _config: ConfigDict) -> bytes:
+    # canon (sorted keys) is only the cache key; the payload serializes the
+    # config itself so key order matches what save_config_to_disk writes.
+    # Kept as bytes: the download button sends bytes as-is, so only the
+    # opt-in inline preview ever pays for a decode.
+    del canon
+    return orjson.dumps(
+        _config, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+    )
+
+
+@st.fragment
+def render_preview_and_export(config: ConfigDict, notes: list[str]) -> None:
+    # A fragment: toggling the preview or editing the output path reruns only
+    # this section, so the rest of the page never re-emits for it.
+    with st.expander("8. Preview and export", expanded=True):
+        for note in notes:
+            st.caption(note)
+        # Canonical bytes act as the cache key, so reruns that do not change the
+        # config skip the pretty-printing entirely.
+        canon = orjson.dumps(config, option=orjson.OPT_SORT_KEYS)
+        # The inline preview is opt-in: syntax highlighting a large config on
+        # every rerun is far more expensive than the download itself.
+        if st.toggle("Show preview", value=False, key="show_preview"):
+            st.code(_serialize_preview(canon, config).decode(), language="json")
+        state = st.session_state
+        state.setdefault("output_path", "config.json")
+        output_path = st.text_input(
+            "Output path",
+            value=state["output_path"],
+            key=widget_key("output-path"),
+        )
+        state["output_path"] = output_path
+        filename = _output_filename(output_path)
+        cols = _two_cols()
+        with cols[0]:
+            st.download_button(
+                "Download JSON",
+                data=_serialize_preview(canon, config),
+                file_name=filename,
+                mime="application/json",
+                key=widget_key("download-config"),
+            )
+        with cols[1]:
+            if st.button("Save to disk", key=widget_key("save-config")):
+                path = save_config_to_disk(config, output_path)
+                st.success(f"Saved to {path}")
@@ -1,9 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from string import Template
+
 TEMPLATE = """
 {
-  "cache_dir": "./cache/<<DATASET>>",
+  "cache_dir": "./cache/$dataset",
 
   "gold_standard_configuration": {
-    "path": "./datasets/req2req/<<DATASET>>/answer.csv",
+    "path": "./datasets/req2req/$dataset/answer.csv",
     "hasHeader": "true"
   },
 
@@ -11,14 +15,14 @@ TEMPLATE = """
     "name" : "text",
     "args" : {
       "artifact_type" : "requirement",
-      "path" : "./datasets/req2req/<<DATASET>>/high"
+      "path" : "./datasets/req2req/$dataset/high"
     }
   },
   "target_artifact_provider" : {
     "name" : "text",
     "args" : {
       "artifact_type" : "requirement",
-      "path" : "./datasets/req2req/<<DATASET>>/low"
+      "path" : "./datasets/req2req/$dataset/low"
     }
   },
   "source_preprocessor" : {
@@ -42,13 +46,13 @@ TEMPLATE = """
   "target_store" : {
     "name" : "custom",
     "args" : {
-      "max_results" : "<<RETRIEVAL_COUNT>>"
+      "max_results" : "$retrieval_count"
     }
   },
   "classifier" : {
-    "name" : "<<CLASSIFIER_MODE>>",
+    "name" : "$classifier_mode",
     "args" : {
-      <<ARGS>>
+      $args
     }
   },
   "result_aggregator" : {
@@ -56,7 +60,7 @@ TEMPLATE = """
     "args" : {}
   },
   "tracelinkid_postprocessor" : {
-    "name" : "<<POSTPROCESSOR>>",
+    "name" : "$postprocessor",
     "args" : {}
   }
 }
@@ -82,18 +86,35 @@ openwebui_args = [arg if "gpt-5" not in arg else f"{arg}, \"temperature\": 1" fo
 
 dir = "req2req"
 
+# Compiled once: Template runs its placeholder scan at construction, so the
+# per-file substitute call only walks the precomputed pattern.
+_TPL = Template(TEMPLATE)
+
+def write_config(path, dataset, classifier_mode, args, postprocessor, retrieval_count):
+    payload = _TPL.substitute(
+        dataset=dataset,
+        classifier_mode=classifier_mode,
+        args=args,
+        postprocessor=postprocessor,
+        retrieval_count=retrieval_count,
+    )
+    Path(path).write_bytes(payload.encode())
+
+jobs = []
 for dataset, postprocessor, retrieval_count in zip(datasets, postprocessors, retrieval_counts):
-    with open(f"./configs/{dir}/{dataset}_no_llm.json", "w") as f:
-        f.write(TEMPLATE.replace("<<DATASET>>", dataset).replace("<<CLASSIFIER_MODE>>", "mock").replace("<<ARGS>>", "").replace("<<POSTPROCESSOR>>", postprocessor).replace("<<RETRIEVAL_COUNT>>", retrieval_count))
+    jobs.append((f"./configs/{dir}/{dataset}_no_llm.json", dataset, "mock", "", postprocessor, retrieval_count))
     for classifier_mode in classifier_modes:
         for gpt_model, gpt_arg in zip(gpt_models, gpt_args):
-            with open(f"./configs/{dir}/{dataset}_{classifier_mode}_gpt_{gpt_model}.json", "w") as f:
-                f.write(TEMPLATE.replace("<<DATASET>>", dataset).replace("<<CLASSIFIER_MODE>>", classifier_mode+"_openai").replace("<<ARGS>>", gpt_arg).replace("<<POSTPROCESSOR>>", postprocessor).replace("<<RETRIEVAL_COUNT>>", retrieval_count))
+            jobs.append((f"./configs/{dir}/{dataset}_{classifier_mode}_gpt_{gpt_model}.json", dataset, classifier_mode+"_openai", gpt_arg, postprocessor, retrieval_count))
 
         for ollama_model, ollama_arg in zip(ollama_models, ollama_args):
-            with open(f"./configs/{dir}/{dataset}_{classifier_mode}_ollama_{ollama_model.replace(':', '_')}.json", "w") as f:
-                f.write(TEMPLATE.replace("<<DATASET>>", dataset).replace("<<CLASSIFIER_MODE>>", classifier_mode+"_ollama").replace("<<ARGS>>", ollama_arg).replace("<<POSTPROCESSOR>>", postprocessor).replace("<<RETRIEVAL_COUNT>>", retrieval_count))
+            jobs.append((f"./configs/{dir}/{dataset}_{classifier_mode}_ollama_{ollama_model.replace(':', '_')}.json", dataset, classifier_mode+"_ollama", ollama_arg, postprocessor, retrieval_count))
 
         for openwebui_model, openwebui_arg in zip(openwebui_models, openwebui_args):
-            with open(f"./configs/{dir}/{dataset}_{classifier_mode}_owu_{openwebui_model.replace(':', '_')}.json", "w") as f:
-                f.write(TEMPLATE.replace("<<DATASET>>", dataset).replace("<<CLASSIFIER_MODE>>", classifier_mode+"_openwebui").replace("<<ARGS>>", openwebui_arg).replace("<<POSTPROCESSOR>>", postprocessor).replace("<<RETRIEVAL_COUNT>>", retrieval_count))
+            jobs.append((f"./configs/{dir}/{dataset}_{classifier_mode}_owu_{openwebui_model.replace(':', '_')}.json", dataset, classifier_mode+"_openwebui", openwebui_arg, postprocessor, retrieval_count))
+
+# Writes are independent and the GIL is released during write(), so the
+# open/write/close latency of the files overlaps across a small pool.
+with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+    for _ in executor.map(lambda job: write_config(*job), jobs):
+        pass